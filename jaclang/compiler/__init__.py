@@ -12,16 +12,21 @@ if not os.path.exists(os.path.join(cur_dir, "__jac_gen__", "jac_parser.py")):
     os.makedirs(os.path.join(cur_dir, "__jac_gen__"), exist_ok=True)
     with open(os.path.join(cur_dir, "__jac_gen__", "__init__.py"), "w"):
         pass
+    # Generate to a per-process temp file and move it into place atomically so
+    # concurrent first imports (e.g. pytest-xdist workers) never see a partial file
+    gen_path = os.path.join(cur_dir, "__jac_gen__", "jac_parser.py")
+    tmp_path = f"{gen_path}.{os.getpid()}.tmp"
     save_argv = sys.argv
     sys.argv = [
         "lark",
         os.path.join(cur_dir, "jac.lark"),
         "-o",
-        os.path.join(cur_dir, "__jac_gen__", "jac_parser.py"),
+        tmp_path,
         "-c",
     ]
     standalone.main()  # type: ignore
     sys.argv = save_argv
+    os.replace(tmp_path, gen_path)
 
 from .__jac_gen__ import jac_parser as jac_lark  # noqa: E402
 
@@ -13,25 +13,40 @@ from jaclang.compiler.symtable import Symbol, SymbolAccess, SymbolTable, SymbolT
 from jaclang.utils.treeprinter import dotgen_ast_tree, print_ast_tree
 
 
+# Shared by nodes that have no sub nodes; SubNodeTabPass never mutates it.
+EMPTY_SUB_NODE_TAB: dict[type, list[AstNode]] = {}
+
+
 class AstNode:
     """Abstract syntax tree node for Jac."""
 
     def __init__(self, kid: Sequence[AstNode]) -> None:
         """Initialize ast."""
         self.parent: Optional[AstNode] = None
-        self.kid: list[AstNode] = [x.set_parent(self) for x in kid]
+        self.kid: list[AstNode] = [*kid]
+        for x in self.kid:
+            x.parent = self
         self.sym_tab: Optional[SymbolTable] = None
-        self._sub_node_tab: dict[type, list[AstNode]] = {}
+        self._sub_node_tab: dict[type, list[AstNode]] = EMPTY_SUB_NODE_TAB
+        self._sub_node_tab_stale = False
         self._typ: type = type(None)
         self.gen: CodeGenTarget = CodeGenTarget()
-        self.meta: dict[str, str] = {}
+        self._meta: Optional[dict[str, str]] = None
         self.loc: CodeLocInfo = CodeLocInfo(*self.resolve_tok_range())
 
+    @property
+    def meta(self) -> dict[str, str]:
+        """Get meta data, allocated on first use."""
+        if self._meta is None:
+            self._meta = {}
+        return self._meta
+
     def add_kids_left(
         self, nodes: Sequence[AstNode], pos_update: bool = True
     ) -> AstNode:
         """Add kid left."""
         self.kid = [*nodes, *self.kid]
+        self._sub_node_tab_stale = True
         if pos_update:
             for i in nodes:
                 i.parent = self
@@ -43,6 +58,7 @@ class AstNode:
     ) -> AstNode:
         """Add kid right."""
         self.kid = [*self.kid, *nodes]
+        self._sub_node_tab_stale = True
         if pos_update:
             for i in nodes:
                 i.parent = self
@@ -52,16 +68,12 @@ class AstNode:
     def set_kids(self, nodes: Sequence[AstNode]) -> AstNode:
         """Set kids."""
         self.kid = [*nodes]
+        self._sub_node_tab_stale = True
         for i in nodes:
             i.parent = self
         self.loc.update_token_range(*self.resolve_tok_range())
         return self
 
-    def set_parent(self, parent: AstNode) -> AstNode:
-        """Set parent."""
-        self.parent = parent
-        return self
-
     def resolve_tok_range(self) -> tuple[Token, Token]:
         """Get token range."""
         if len(self.kid):
@@ -72,7 +84,7 @@ class AstNode:
         elif isinstance(self, Token):
             return (self, self)
         else:
-            raise ValueError(f"Empty kid for Token {type(self).__name__}")
+            raise ValueError(f"Empty kid for Token {self.__class__.__name__}")
 
     def get_all_sub_nodes(self, typ: Type[T], brute_force: bool = True) -> list[T]:
         """Get all sub nodes of type."""
@@ -82,16 +94,21 @@ class AstNode:
 
     def to_dict(self) -> dict[str, str]:
         """Return dict representation of node."""
-        ret = {
-            "node": str(type(self).__name__),
-            "kid": str([x.to_dict() for x in self.kid if x]),
-            "line": str(self.loc.first_line),
-            "col": str(self.loc.col_start),
-        }
-        if isinstance(self, Token):
-            ret["name"] = self.name
-            ret["value"] = self.value
-        return ret
+        order: list[AstNode] = []
+        stack: list[AstNode] = [self]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(x for x in node.kid if x.kid)
+        done: dict[int, dict[str, str]] = {}
+        for node in reversed(order):
+            done[id(node)] = {
+                "node": node.__class__.__name__,
+                "kid": str([done[id(x)] if x.kid else x.to_dict() for x in node.kid]),
+                "line": str(node.loc.first_line),
+                "col": str(node.loc.col_start),
+            }
+        return done[id(self)]
 
     def pp(self, depth: Optional[int] = None) -> str:
         """Print ast."""
@@ -2087,6 +2104,12 @@ class Token(AstNode):
         self.pos_end = pos_end
         AstNode.__init__(self, kid=[])
 
+    def to_dict(self) -> dict[str, str]:
+        """Return dict representation of token."""
+        res = super().to_dict()
+        res.update({"name": self.name, "value": self.value})
+        return res
+
 
 class Name(Token, NameSpec):
     """Name node type for Jac Ast."""
@@ -2364,9 +2387,12 @@ class CommentToken(Token):
 class JacSource(EmptyToken):
     """SourceString node type for Jac Ast."""
 
-    def __init__(self, source: str, mod_path: str) -> None:
-        """Initialize source string."""
+    def __init__(self, source: str | bytes, mod_path: str) -> None:
+        """Initialize source string, decoding raw file bytes as UTF-8."""
         super().__init__()
+        if isinstance(source, bytes):
+            # Same newline handling as reading the file in text mode
+            source = source.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
         self.value = source
         self.file_path = mod_path
         self.comments: list[CommentToken] = []
@@ -6,26 +6,27 @@ import ast as ast3
 from dataclasses import dataclass, field
 from typing import Optional, TYPE_CHECKING
 
-from jaclang.vendor.mypy.nodes import Node as MypyNode
-
 if TYPE_CHECKING:
     from jaclang.compiler.absyntree import Token
+    from jaclang.vendor.mypy.nodes import Node as MypyNode
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeGenTarget:
     """Code generation target."""
 
     py: str = ""
     jac: str = ""
-    py_ast: list[ast3.AST] = field(default_factory=lambda: [])
-    mypy_ast: list[MypyNode] = field(default_factory=lambda: [])
+    py_ast: list[ast3.AST] = field(default_factory=list)
+    mypy_ast: list[MypyNode] = field(default_factory=list)
     py_bytecode: Optional[bytes] = None
 
 
 class CodeLocInfo:
     """Code location info."""
 
+    __slots__ = ("first_tok", "last_tok")
+
     def __init__(
         self,
         first_tok: Token,
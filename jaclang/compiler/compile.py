@@ -29,17 +29,18 @@ def jac_file_to_pass(
     schedule: list[Type[Pass]] = pass_schedule,
 ) -> Pass:
     """Convert a Jac file to an AST."""
-    with open(file_path) as file:
-        return jac_str_to_pass(
-            jac_str=file.read(),
-            file_path=file_path,
-            target=target,
-            schedule=schedule,
-        )
+    with open(file_path, "rb") as file:
+        jac_str = file.read()
+    return jac_str_to_pass(
+        jac_str=jac_str,
+        file_path=file_path,
+        target=target,
+        schedule=schedule,
+    )
 
 
 def jac_str_to_pass(
-    jac_str: str,
+    jac_str: str | bytes,
     file_path: str,
     target: Optional[Type[Pass]] = None,
     schedule: list[Type[Pass]] = pass_schedule,
@@ -80,9 +81,9 @@ def jac_file_formatter(
 ) -> JacFormatPass:
     """Convert a Jac file to an AST."""
     target = JacFormatPass
-    with open(file_path) as file:
+    with open(file_path, "rb") as file:
         source = ast.JacSource(file.read(), mod_path=file_path)
-        prse: Pass = JacParser(input_ir=source)
+    prse: Pass = JacParser(input_ir=source)
     for i in schedule:
         if i == target:
             break
@@ -5,7 +5,9 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Callable, TypeAlias
+import sys
+from copy import copy
+from typing import Any, Callable, Optional, TypeAlias
 
 
 import jaclang.compiler.absyntree as ast
@@ -13,6 +15,94 @@ from jaclang.compiler import jac_lark as jl  # type: ignore
 from jaclang.compiler.constant import EdgeDir, Tokens as Tok
 from jaclang.compiler.passes.ir_pass import Pass
 from jaclang.vendor.lark import Lark, Transformer, Tree, logger
+from jaclang.vendor.lark import Token as LarkToken, UnexpectedInput
+from jaclang.vendor.lark.parsers.lalr_parser_state import ParserState
+
+# The standalone parser and the dev mode (vendored lark) parser each have
+# their own token and error classes
+TOKEN_TYPES = (jl.Token, LarkToken)
+UNEXPECTED_INPUT_TYPES = (jl.UnexpectedInput, UnexpectedInput)
+
+
+def copy_parser_state(state: Any) -> Any:  # noqa: ANN401
+    """Copy a LALR parser state, sharing the values on its stack.
+
+    Lark deep copies the value stack on every copy. Syntax error reporting
+    copies the state once per candidate terminal, and with the AST built
+    during the parse, each deep copy duplicates every node parsed so far.
+    Stack values are never mutated by the copies lark makes while probing
+    for expected tokens, so a shallow copy of the stack is enough.
+    """
+    return type(state)(
+        state.parse_conf,
+        state.lexer,
+        copy(state.state_stack),
+        copy(state.value_stack),
+    )
+
+
+jl.ParserState.__copy__ = copy_parser_state
+ParserState.__copy__ = copy_parser_state  # type: ignore
+
+
+class ReduceCallbacks:
+    """Lark transformer that runs TreeToAST rules as the parser reduces.
+
+    Passing this as the ``transformer`` of the LALR parser builds the AST
+    directly during parsing, so no intermediate parse tree is built and
+    walked again afterwards.
+    """
+
+    def __init__(self) -> None:
+        """Initialize reduce callbacks."""
+        self.tree_to_ast: Optional[JacParser.TreeToAST] = None
+
+    def __getattr__(self, name: str) -> Callable[[list], ast.AstNode]:
+        """Return the reduce callback for grammar rule `name`.
+
+        Lark asks for these once, while building the parser (before TreeToAST
+        exists), so the rule function is looked up on the class of the bound
+        TreeToAST at reduction time and cached until that class changes.
+        """
+        if name.startswith("_") or name.isupper():
+            raise AttributeError(name)
+        rule_cls: Optional[type[JacParser.TreeToAST]] = None
+        rule: Callable[[JacParser.TreeToAST, list], ast.AstNode]
+        node_type: Optional[type[ast.AstNode]] = None
+
+        def reduce(kid: list) -> ast.AstNode:
+            nonlocal rule_cls, rule, node_type
+            tree_to_ast = self.tree_to_ast
+            if tree_to_ast is None:
+                raise RuntimeError("No TreeToAST bound to the parser.")
+            if type(tree_to_ast) is not rule_cls:
+                rule_cls = type(tree_to_ast)
+                rule = getattr(rule_cls, name)
+                # Only shortcut passthroughs when the base rule isn't overridden
+                node_type = (
+                    JacParser.TreeToAST.passthrough_rules.get(name)
+                    if rule is getattr(JacParser.TreeToAST, name)
+                    else None
+                )
+            if (
+                node_type is not None
+                and len(kid) == 1
+                and isinstance(kid[0], node_type)
+            ):
+                return tree_to_ast.nu(kid[0])
+            return rule(
+                tree_to_ast,
+                [
+                    (
+                        tree_to_ast.__default_token__(i)
+                        if isinstance(i, TOKEN_TYPES)
+                        else i
+                    )
+                    for i in kid
+                ],
+            )
+
+        return reduce
 
 
 class JacParser(Pass):
@@ -24,19 +114,20 @@ class JacParser(Pass):
         """Initialize parser."""
         self.source = input_ir
         self.mod_path = input_ir.loc.mod_path
-        if JacParser.dev_mode:
+        if JacParser.dev_mode and not isinstance(JacParser.parser, Lark):
             JacParser.make_dev()
         Pass.__init__(self, input_ir=input_ir, prior=None)
 
     def transform(self, ir: ast.AstNode) -> ast.AstNode:
         """Transform input IR."""
         try:
-            tree, comments = JacParser.parse(
-                self.source.value, on_error=self.error_callback
+            mod, comments = JacParser.parse(
+                self.source.value,
+                on_error=self.error_callback,
+                tree_to_ast=JacParser.TreeToAST(parser=self),
             )
-            mod = JacParser.TreeToAST(parser=self).transform(tree)
             self.source.comments = [self.proc_comment(i, mod) for i in comments]
-        except jl.UnexpectedInput as e:
+        except UNEXPECTED_INPUT_TYPES as e:
             catch_error = ast.EmptyToken()
             catch_error.file_path = self.mod_path
             catch_error.line_no = e.line
@@ -54,7 +145,7 @@ class JacParser(Pass):
         """Process comment."""
         return ast.CommentToken(
             file_path=mod.loc.mod_path,
-            name=token.type,
+            name=sys.intern(token.type),
             value=token.value,
             line=token.line if token.line is not None else 0,
             col_start=token.column if token.column is not None else 0,
@@ -74,14 +165,20 @@ class JacParser(Pass):
 
     @staticmethod
     def parse(
-        ir: str, on_error: Callable[[jl.UnexpectedInput], bool]
-    ) -> tuple[jl.Tree[jl.Tree[str]], list[jl.Token]]:
+        ir: str,
+        on_error: Callable[[jl.UnexpectedInput], bool],
+        tree_to_ast: JacParser.TreeToAST,
+    ) -> tuple[ast.AstNode, list[jl.Token]]:
         """Parse input IR."""
         JacParser.comment_cache = []
-        return (
-            JacParser.parser.parse(ir, on_error=on_error),
-            JacParser.comment_cache,
-        )
+        JacParser.reducer.tree_to_ast = tree_to_ast
+        try:
+            return (
+                JacParser.parser.parse(ir, on_error=on_error),
+                JacParser.comment_cache,
+            )
+        finally:
+            JacParser.reducer.tree_to_ast = None
 
     @staticmethod
     def make_dev() -> None:
@@ -91,6 +188,7 @@ class JacParser(Pass):
             parser="lalr",
             rel_to=__file__,
             debug=True,
+            transformer=JacParser.reducer,
             lexer_callbacks={"COMMENT": JacParser._comment_callback},
         )
         JacParser.JacTransformer = Transformer[Tree[str], ast.AstNode]  # type: ignore
@@ -98,7 +196,10 @@ class JacParser(Pass):
 
     comment_cache: list[jl.Token] = []
 
-    parser = jl.Lark_StandAlone(lexer_callbacks={"COMMENT": _comment_callback})  # type: ignore
+    reducer = ReduceCallbacks()
+    parser = jl.Lark_StandAlone(  # type: ignore
+        transformer=reducer, lexer_callbacks={"COMMENT": _comment_callback}
+    )
     JacTransformer: TypeAlias = jl.Transformer[jl.Tree[str], ast.AstNode]
 
     class TreeToAST(JacTransformer):
@@ -3800,15 +3901,66 @@ class JacParser(Pass):
             else:
                 raise self.ice()
 
+        # Rules that return a lone child of the given type unchanged. The reduce
+        # callbacks hand such children straight through without the rule call.
+        passthrough_rules: dict[str, type[ast.AstNode]] = {
+            "start": ast.Module,
+            "expression": ast.Expr,
+            "walrus_assign": ast.Expr,
+            "pipe": ast.Expr,
+            "pipe_back": ast.Expr,
+            "elvis_check": ast.Expr,
+            "bitwise_or": ast.Expr,
+            "bitwise_xor": ast.Expr,
+            "bitwise_and": ast.Expr,
+            "shift": ast.Expr,
+            "logical_or": ast.Expr,
+            "logical_and": ast.Expr,
+            "logical_not": ast.Expr,
+            "compare": ast.Expr,
+            "arithmetic": ast.Expr,
+            "term": ast.Expr,
+            "factor": ast.Expr,
+            "power": ast.Expr,
+            "connect": ast.Expr,
+            "atomic_pipe": ast.Expr,
+            "atomic_pipe_back": ast.Expr,
+            "ds_spawn": ast.Expr,
+            "unpack": ast.Expr,
+            "ref": ast.Expr,
+            "pipe_call": ast.Expr,
+            "atomic_chain": ast.Expr,
+            "atom": ast.AtomExpr,
+            "atom_collection": ast.AtomExpr,
+            "any_ref": ast.NameSpec,
+        }
+
+        token_types: dict[str, type[ast.Token]] = {
+            Tok.NAME.value: ast.Name,
+            Tok.SEMI.value: ast.Semi,
+            Tok.NULL.value: ast.Null,
+            Tok.ELLIPSIS.value: ast.Ellipsis,
+            Tok.FLOAT.value: ast.Float,
+            Tok.INT.value: ast.Int,
+            Tok.HEX.value: ast.Int,
+            Tok.BIN.value: ast.Int,
+            Tok.OCT.value: ast.Int,
+            Tok.STRING.value: ast.String,
+            Tok.FSTR_BESC.value: ast.String,
+            Tok.FSTR_PIECE.value: ast.String,
+            Tok.FSTR_SQ_PIECE.value: ast.String,
+            Tok.DOC_STRING.value: ast.String,
+            Tok.BOOL.value: ast.Bool,
+        }
+
         def __default_token__(self, token: jl.Token) -> ast.Token:
             """Token handler."""
-            ret_type = ast.Token
             if token.type == Tok.KWESC_NAME:
                 return self.nu(
                     ast.Name(
                         file_path=self.parse_ref.mod_path,
-                        name=token.type,
-                        value=token.value[2:],
+                        name=sys.intern(token.type),
+                        value=sys.intern(token.value[2:]),
                         line=token.line if token.line is not None else 0,
                         col_start=token.column if token.column is not None else 0,
                         col_end=token.end_column if token.end_column is not None else 0,
@@ -3817,36 +3969,17 @@ class JacParser(Pass):
                         is_kwesc=True,
                     )
                 )
-            elif token.type == Tok.NAME:
-                ret_type = ast.Name
-            elif token.type == Tok.SEMI:
-                ret_type = ast.Semi
-            elif token.type == Tok.NULL:
-                ret_type = ast.Null
-            elif token.type == Tok.ELLIPSIS:
-                ret_type = ast.Ellipsis
-            elif token.type == Tok.FLOAT:
-                ret_type = ast.Float
-            elif token.type in [Tok.INT, Tok.INT, Tok.HEX, Tok.BIN, Tok.OCT]:
-                ret_type = ast.Int
-            elif token.type in [
-                Tok.STRING,
-                Tok.FSTR_BESC,
-                Tok.FSTR_PIECE,
-                Tok.FSTR_SQ_PIECE,
-                Tok.DOC_STRING,
-            ]:
-                ret_type = ast.String
-                if token.type == Tok.FSTR_BESC:
-                    token.value = token.value[1:]
-            elif token.type == Tok.BOOL:
-                ret_type = ast.Bool
+            ret_type = self.token_types.get(token.type, ast.Token)
+            if token.type == Tok.NAME:
+                token.value = sys.intern(token.value)
+            elif token.type == Tok.FSTR_BESC:
+                token.value = token.value[1:]
             elif token.type == Tok.PYNLINE and isinstance(token.value, str):
                 token.value = token.value.replace("::py::", "")
             return self.nu(
                 ret_type(
                     file_path=self.parse_ref.mod_path,
-                    name=token.type,
+                    name=sys.intern(token.type),
                     value=token.value,
                     line=token.line if token.line is not None else 0,
                     col_start=token.column if token.column is not None else 0,
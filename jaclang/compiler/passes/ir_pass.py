@@ -1,6 +1,6 @@
 """Abstract class for IR Passes for Jac."""
 
-from typing import Optional, Type
+from typing import ClassVar, Optional, Type
 
 import jaclang.compiler.absyntree as ast
 from jaclang.compiler.passes.transform import Transform
@@ -10,6 +10,16 @@ from jaclang.utils.helpers import pascal_to_snake
 class Pass(Transform[ast.T]):
     """Abstract class for IR passes."""
 
+    # Handler method name (or None) per node type, filled in per pass class
+    enter_handlers: ClassVar[dict[type, Optional[str]]] = {}
+    exit_handlers: ClassVar[dict[type, Optional[str]]] = {}
+
+    def __init_subclass__(cls) -> None:
+        """Give each pass class its own handler lookup tables."""
+        super().__init_subclass__()
+        cls.enter_handlers = {}
+        cls.exit_handlers = {}
+
     def __init__(self, input_ir: ast.T, prior: Optional[Transform]) -> None:
         """Initialize parser."""
         self.term_signal = False
@@ -27,13 +37,24 @@ class Pass(Transform[ast.T]):
 
     def enter_node(self, node: ast.AstNode) -> None:
         """Run on entering node."""
-        if hasattr(self, f"enter_{pascal_to_snake(type(node).__name__)}"):
-            getattr(self, f"enter_{pascal_to_snake(type(node).__name__)}")(node)
+        if type(node) not in self.enter_handlers:
+            self.enter_handlers[type(node)] = self.find_handler("enter", node)
+        handler = self.enter_handlers[type(node)]
+        if handler:
+            getattr(self, handler)(node)
 
     def exit_node(self, node: ast.AstNode) -> None:
         """Run on exiting node."""
-        if hasattr(self, f"exit_{pascal_to_snake(type(node).__name__)}"):
-            getattr(self, f"exit_{pascal_to_snake(type(node).__name__)}")(node)
+        if type(node) not in self.exit_handlers:
+            self.exit_handlers[type(node)] = self.find_handler("exit", node)
+        handler = self.exit_handlers[type(node)]
+        if handler:
+            getattr(self, handler)(node)
+
+    def find_handler(self, prefix: str, node: ast.AstNode) -> Optional[str]:
+        """Get name of this pass's handler for node type, if it has one."""
+        handler = f"{prefix}_{pascal_to_snake(type(node).__name__)}"
+        return handler if hasattr(self, handler) else None
 
     def terminate(self) -> None:
         """Terminate traversal."""
@@ -73,9 +94,8 @@ class Pass(Transform[ast.T]):
         if not node:
             return
         for i in node.kid:
-            if i:
-                i.parent = node
-                self.recalculate_parents(i)
+            i.parent = node
+            self.recalculate_parents(i)
 
     # Transform Implementations
     # -------------------------
@@ -85,8 +105,6 @@ class Pass(Transform[ast.T]):
         if not isinstance(ir, ast.AstNode):
             return ir
         self.before_pass()
-        if not isinstance(ir, ast.AstNode):
-            raise ValueError("Current node is not an AstNode.")
         self.traverse(ir)
         self.after_pass()
         return self.ir
@@ -99,8 +117,7 @@ class Pass(Transform[ast.T]):
         self.enter_node(node)
         if not self.prune_signal:
             for i in node.kid:
-                if i:
-                    self.traverse(i)
+                self.traverse(i)
         else:
             self.prune_signal = False
         self.cur_node = node
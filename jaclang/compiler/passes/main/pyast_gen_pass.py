@@ -3132,6 +3132,51 @@ class PyastGenPass(Pass):
             )
         ]
 
+    token_ops: dict[str, type[ast3.AST]] = {
+        Tok.KW_AND.value: ast3.And,
+        Tok.KW_OR.value: ast3.Or,
+        Tok.PLUS.value: ast3.Add,
+        Tok.ADD_EQ.value: ast3.Add,
+        Tok.BW_AND.value: ast3.BitAnd,
+        Tok.BW_AND_EQ.value: ast3.BitAnd,
+        Tok.BW_OR.value: ast3.BitOr,
+        Tok.BW_OR_EQ.value: ast3.BitOr,
+        Tok.BW_XOR.value: ast3.BitXor,
+        Tok.BW_XOR_EQ.value: ast3.BitXor,
+        Tok.DIV.value: ast3.Div,
+        Tok.DIV_EQ.value: ast3.Div,
+        Tok.FLOOR_DIV.value: ast3.FloorDiv,
+        Tok.FLOOR_DIV_EQ.value: ast3.FloorDiv,
+        Tok.LSHIFT.value: ast3.LShift,
+        Tok.LSHIFT_EQ.value: ast3.LShift,
+        Tok.MOD.value: ast3.Mod,
+        Tok.MOD_EQ.value: ast3.Mod,
+        Tok.STAR_MUL.value: ast3.Mult,
+        Tok.MUL_EQ.value: ast3.Mult,
+        Tok.DECOR_OP.value: ast3.MatMult,
+        Tok.MATMUL_EQ.value: ast3.MatMult,
+        Tok.STAR_POW.value: ast3.Pow,
+        Tok.STAR_POW_EQ.value: ast3.Pow,
+        Tok.RSHIFT.value: ast3.RShift,
+        Tok.RSHIFT_EQ.value: ast3.RShift,
+        Tok.MINUS.value: ast3.Sub,
+        Tok.SUB_EQ.value: ast3.Sub,
+        Tok.BW_NOT.value: ast3.Invert,
+        Tok.BW_NOT_EQ.value: ast3.Invert,
+        Tok.NOT.value: ast3.Not,
+        Tok.EQ.value: ast3.NotEq,
+        Tok.EE.value: ast3.Eq,
+        Tok.GT.value: ast3.Gt,
+        Tok.GTE.value: ast3.GtE,
+        Tok.KW_IN.value: ast3.In,
+        Tok.KW_IS.value: ast3.Is,
+        Tok.KW_ISN.value: ast3.IsNot,
+        Tok.LT.value: ast3.Lt,
+        Tok.LTE.value: ast3.LtE,
+        Tok.NE.value: ast3.NotEq,
+        Tok.KW_NIN.value: ast3.NotIn,
+    }
+
     def exit_token(self, node: ast.Token) -> None:
         """Sub objects.
 
@@ -3143,62 +3188,9 @@ class PyastGenPass(Pass):
         pos_start: int,
         pos_end: int,
         """
-        if node.name == Tok.KW_AND:
-            node.gen.py_ast = [self.sync(ast3.And())]
-        elif node.name == Tok.KW_OR:
-            node.gen.py_ast = [self.sync(ast3.Or())]
-        elif node.name in [Tok.PLUS, Tok.ADD_EQ]:
-            node.gen.py_ast = [self.sync(ast3.Add())]
-        elif node.name in [Tok.BW_AND, Tok.BW_AND_EQ]:
-            node.gen.py_ast = [self.sync(ast3.BitAnd())]
-        elif node.name in [Tok.BW_OR, Tok.BW_OR_EQ]:
-            node.gen.py_ast = [self.sync(ast3.BitOr())]
-        elif node.name in [Tok.BW_XOR, Tok.BW_XOR_EQ]:
-            node.gen.py_ast = [self.sync(ast3.BitXor())]
-        elif node.name in [Tok.DIV, Tok.DIV_EQ]:
-            node.gen.py_ast = [self.sync(ast3.Div())]
-        elif node.name in [Tok.FLOOR_DIV, Tok.FLOOR_DIV_EQ]:
-            node.gen.py_ast = [self.sync(ast3.FloorDiv())]
-        elif node.name in [Tok.LSHIFT, Tok.LSHIFT_EQ]:
-            node.gen.py_ast = [self.sync(ast3.LShift())]
-        elif node.name in [Tok.MOD, Tok.MOD_EQ]:
-            node.gen.py_ast = [self.sync(ast3.Mod())]
-        elif node.name in [Tok.STAR_MUL, Tok.MUL_EQ]:
-            node.gen.py_ast = [self.sync(ast3.Mult())]
-        elif node.name in [Tok.DECOR_OP, Tok.MATMUL_EQ]:
-            node.gen.py_ast = [self.sync(ast3.MatMult())]
-        elif node.name in [Tok.STAR_POW, Tok.STAR_POW_EQ]:
-            node.gen.py_ast = [self.sync(ast3.Pow())]
-        elif node.name in [Tok.RSHIFT, Tok.RSHIFT_EQ]:
-            node.gen.py_ast = [self.sync(ast3.RShift())]
-        elif node.name in [Tok.MINUS, Tok.SUB_EQ]:
-            node.gen.py_ast = [self.sync(ast3.Sub())]
-        elif node.name in [Tok.BW_NOT, Tok.BW_NOT_EQ]:
-            node.gen.py_ast = [self.sync(ast3.Invert())]
-        elif node.name in [Tok.NOT]:
-            node.gen.py_ast = [self.sync(ast3.Not())]
-        elif node.name in [Tok.EQ]:
-            node.gen.py_ast = [self.sync(ast3.NotEq())]
-        elif node.name == Tok.EE:
-            node.gen.py_ast = [self.sync(ast3.Eq())]
-        elif node.name == Tok.GT:
-            node.gen.py_ast = [self.sync(ast3.Gt())]
-        elif node.name == Tok.GTE:
-            node.gen.py_ast = [self.sync(ast3.GtE())]
-        elif node.name == Tok.KW_IN:
-            node.gen.py_ast = [self.sync(ast3.In())]
-        elif node.name == Tok.KW_IS:
-            node.gen.py_ast = [self.sync(ast3.Is())]
-        elif node.name == Tok.KW_ISN:
-            node.gen.py_ast = [self.sync(ast3.IsNot())]
-        elif node.name == Tok.LT:
-            node.gen.py_ast = [self.sync(ast3.Lt())]
-        elif node.name == Tok.LTE:
-            node.gen.py_ast = [self.sync(ast3.LtE())]
-        elif node.name == Tok.NE:
-            node.gen.py_ast = [self.sync(ast3.NotEq())]
-        elif node.name == Tok.KW_NIN:
-            node.gen.py_ast = [self.sync(ast3.NotIn())]
+        op = self.token_ops.get(node.name)
+        if op is not None:
+            node.gen.py_ast = [self.sync(op())]
 
     def exit_name(self, node: ast.Name) -> None:
         """Sub objects.
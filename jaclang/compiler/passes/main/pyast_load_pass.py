@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import ast as py_ast
 import os
-from typing import Optional, TypeVar, Union
+from typing import Optional, TypeVar
 
 import jaclang.compiler.absyntree as ast
 from jaclang.compiler.constant import Tokens as Tok
@@ -332,7 +332,7 @@ class PyastBuildPass(Pass[ast.PythonModuleAst]):
         else:
             raise self.ice()
         value = self.convert(node.value) if node.value else None
-        valid_types = Union[ast.Expr, ast.YieldExpr]
+        valid_types = (ast.Expr, ast.YieldExpr)
         if (
             isinstance(target, ast.SubNodeList)
             and (isinstance(value, valid_types) or not value)
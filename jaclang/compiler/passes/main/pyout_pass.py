@@ -50,8 +50,7 @@ class PyOutPass(Pass):
     def gen_python(self, node: ast.Module, out_path: str) -> None:
         """Generate Python."""
         try:
-            with open(out_path, "w") as f:
-                f.write(node.gen.py)
+            self.write_atomic(out_path, node.gen.py)
         except Exception as e:
             print(ast3.dump(node.gen.py_ast[0], indent=2))
             raise e
@@ -59,19 +58,25 @@ class PyOutPass(Pass):
     def dump_bytecode(self, node: ast.Module, mod_path: str, out_path: str) -> None:
         """Generate Python."""
         if node.gen.py_bytecode:
-            with open(out_path, "wb") as f:
-                f.write(node.gen.py_bytecode)
+            self.write_atomic(out_path, node.gen.py_bytecode)
         else:
             self.error(
                 f"Soemthing went wrong with {node.loc.mod_path} compilation.", node
             )
 
+    def write_atomic(self, out_path: str, data: str | bytes) -> None:
+        """Write via a temp file so concurrent importers never read a partial file."""
+        tmp_path = f"{out_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb" if isinstance(data, bytes) else "w") as f:
+            f.write(data)
+        os.replace(tmp_path, out_path)
+
     def get_output_targets(self, node: ast.Module) -> tuple[str, str, str]:
         """Get output targets."""
         base_path, file_name = os.path.split(node.loc.mod_path)
         gen_path = os.path.join(base_path, Con.JAC_GEN_DIR)
         os.makedirs(gen_path, exist_ok=True)
-        with open(os.path.join(gen_path, "__init__.py"), "w"):
+        with open(os.path.join(gen_path, "__init__.py"), "a"):
             pass
         mod_dir, file_name = os.path.split(node.loc.mod_path)
         mod_dir = mod_dir.replace(base_path, "").lstrip(os.sep)
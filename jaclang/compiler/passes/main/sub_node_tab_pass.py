@@ -2,7 +2,8 @@
 
 This pass builds a table of subnodes for each node in the AST. This is used
 for fast lookup of nodes of a certain type in the AST. This is just a utility
-pass and is not required for any other pass to work.
+pass and is not required for any other pass to work. When rerun on a tree it
+only rebuilds tables along paths to nodes whose kids have changed.
 """
 
 from copy import copy
@@ -18,24 +19,31 @@ class SubNodeTabPass(Pass):
     def before_pass(self) -> None:
         """Initialize pass."""
         self.cur_module: Optional[ast.Module] = None
-
-    def enter_node(self, node: ast.AstNode) -> None:
-        """Table builder."""
-        super().enter_node(node)
-        node._sub_node_tab = {}  # clears on entry
+        self.rebuilt: set[int] = set()
 
     def exit_node(self, node: ast.AstNode) -> None:
         """Table builder."""
         super().exit_node(node)
+        if not node.kid:
+            node._sub_node_tab = ast.EMPTY_SUB_NODE_TAB
+            return
+        if (
+            node._sub_node_tab is not ast.EMPTY_SUB_NODE_TAB
+            and not node._sub_node_tab_stale
+            and not any(id(i) in self.rebuilt for i in node.kid)
+        ):
+            return  # Subtree unchanged since last run, keep its table
+        sub_node_tab: dict[type, list[ast.AstNode]] = {}
         for i in node.kid:
-            if not i:
-                continue
             for k, v in i._sub_node_tab.items():
-                if k in node._sub_node_tab:
-                    node._sub_node_tab[k].extend(v)
+                if k in sub_node_tab:
+                    sub_node_tab[k].extend(v)
                 else:
-                    node._sub_node_tab[k] = copy(v)
-            if type(i) in node._sub_node_tab:
-                node._sub_node_tab[type(i)].append(i)
+                    sub_node_tab[k] = copy(v)
+            if type(i) in sub_node_tab:
+                sub_node_tab[type(i)].append(i)
             else:
-                node._sub_node_tab[type(i)] = [i]
+                sub_node_tab[type(i)] = [i]
+        node._sub_node_tab = sub_node_tab
+        node._sub_node_tab_stale = False
+        self.rebuilt.add(id(node))
@@ -1,6 +1,8 @@
 """Test sub node pass module."""
 
+import jaclang.compiler.absyntree as ast
 from jaclang.compiler.compile import jac_file_to_pass
+from jaclang.compiler.constant import Tokens as Tok
 from jaclang.compiler.passes.main import SubNodeTabPass
 from jaclang.utils.test import TestCase
 
@@ -25,3 +27,30 @@ class SubNodePassTests(TestCase):
                 for n in v:
                     self.assertIn(n, code_gen.get_all_sub_nodes(i, k, brute_force=True))
         self.assertFalse(code_gen.errors_had)
+
+    def test_sub_node_pass_rerun(self) -> None:
+        """Test rerun only rebuilds tables along changed paths."""
+        code_gen = jac_file_to_pass(
+            file_path=self.fixture_abs_path(
+                "../../../../../../examples/manual_code/circle.jac"
+            ),
+            target=SubNodeTabPass,
+        )
+        body = code_gen.ir.kid[1]
+        old_tabs = [i._sub_node_tab for i in body.kid]
+        new_kid = ast.Semi(
+            file_path="",
+            name=Tok.SEMI.value,
+            value=";",
+            line=0,
+            col_start=0,
+            col_end=0,
+            pos_start=0,
+            pos_end=0,
+        )
+        body.kid[0].add_kids_right([new_kid], pos_update=False)
+        SubNodeTabPass(input_ir=code_gen.ir, prior=code_gen)
+        self.assertIsNot(body.kid[0]._sub_node_tab, old_tabs[0])
+        self.assertIn(new_kid, code_gen.get_all_sub_nodes(code_gen.ir, ast.Semi))
+        for i, tab in zip(body.kid[1:], old_tabs[1:]):
+            self.assertIs(i._sub_node_tab, tab)
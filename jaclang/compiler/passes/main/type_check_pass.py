@@ -10,7 +10,6 @@ import sys
 
 
 import jaclang.compiler.absyntree as ast
-import jaclang.compiler.passes.utils.mypy_ast_build as myab
 from jaclang.compiler.passes import Pass
 
 
@@ -43,6 +42,9 @@ class JacTypeCheckPass(Pass):
 
     def api(self) -> None:
         """Call mypy APIs to implement type checking in Jac."""
+        # Deferred so importing the pass schedules doesn't pull in mypy
+        import jaclang.compiler.passes.utils.mypy_ast_build as myab
+
         # Creating mypy api objects
         options = myab.myb.Options()
         errors = myab.Errors(self, options)
@@ -57,23 +57,32 @@ class FuseCommentsPass(Pass):
                 except StopIteration:
                     next_code = None
 
-        # Insert the tokens back into the AST
-        for i, token in enumerate(new_stream):
-            if isinstance(token, ast.CommentToken):
-                if i == 0:
-                    self.ir.add_kids_left([token])
-                else:
-                    prev_token = new_stream[i - 1]
-                    if prev_token.parent is not None:
-                        parent_kids = prev_token.parent.kid
-                        insert_index = parent_kids.index(prev_token) + 1
-                        parent_kids.insert(insert_index, token)
-                        prev_token.parent.set_kids(parent_kids)
-                    else:
-                        prev_token.pp()
-                        raise self.ice(
-                            "Token without parent in AST should be impossible"
-                        )
+        # Group each comment under the code token it follows
+        leading: list[ast.CommentToken] = []
+        trailing: dict[ast.AstNode, list[ast.CommentToken]] = {}
+        anchor: ast.AstNode | None = None
+        for token in new_stream:
+            if not isinstance(token, ast.CommentToken):
+                anchor = token
+            elif anchor is None:
+                leading.append(token)
+            else:
+                trailing.setdefault(anchor, []).append(token)
+
+        # Insert the tokens back into the AST, rebuilding each parent once
+        parents: dict[ast.AstNode, None] = {}
+        for anchor in trailing:
+            if anchor.parent is None:
+                raise self.ice("Token without parent in AST should be impossible")
+            parents[anchor.parent] = None
+        for parent in parents:
+            new_kids: list[ast.AstNode] = []
+            for kid in parent.kid:
+                new_kids.append(kid)
+                new_kids.extend(trailing.get(kid, ()))
+            parent.set_kids(new_kids)
+        if leading:
+            self.ir.add_kids_left(leading)
 
 
 def is_comment_next(cmt: ast.CommentToken, code: ast.Token) -> bool:
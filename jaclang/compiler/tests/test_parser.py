@@ -1,12 +1,29 @@
 """Tests for Jac parser."""
 
 import inspect
+from unittest.mock import patch
 
+import jaclang.compiler.absyntree as ast
 from jaclang.compiler import jac_lark as jl
-from jaclang.compiler.absyntree import JacSource
+from jaclang.compiler.absyntree import BoolExpr, JacSource
 from jaclang.compiler.constant import Tokens
 from jaclang.compiler.parser import JacParser
 from jaclang.utils.test import TestCaseMicroSuite
+from jaclang.vendor.lark import Lark, logger
+
+
+_LARK = jl.Lark_StandAlone()
+_TERMINAL_NAMES = frozenset(x.name for x in _LARK.parser.lexer_conf.terminals)
+_RULE_NAMES = frozenset(
+    x.origin.name
+    for x in _LARK.parser.parser_conf.rules
+    if not x.origin.name.startswith("_")
+)
+_PARSE_FUNCS = frozenset(
+    name
+    for name, value in JacParser.TreeToAST.__dict__.items()
+    if inspect.isfunction(value) and name not in JacParser.TreeToAST.__base__.__dict__
+)
 
 
 class TestLarkParser(TestCaseMicroSuite):
@@ -22,6 +39,16 @@ class TestLarkParser(TestCaseMicroSuite):
         prse = JacParser(input_ir=source)
         self.assertFalse(prse.errors_had)
 
+    def test_bool_chains_are_flat(self) -> None:
+        """Test and/or chains parse into a single variadic BoolExpr."""
+        prse = JacParser(
+            input_ir=JacSource("glob x = a and b and c or d or e;", mod_path="")
+        )
+        self.assertFalse(prse.errors_had)
+        bool_exprs = prse.ir.get_all_sub_nodes(BoolExpr)
+        self.assertEqual(len(bool_exprs), 2)
+        self.assertEqual(sorted(len(i.values) for i in bool_exprs), [3, 3])
+
     def micro_suite_test(self, filename: str) -> None:
         """Parse micro jac file."""
         prse = JacParser(
@@ -34,6 +61,57 @@ class TestLarkParser(TestCaseMicroSuite):
         prse = JacParser(input_ir=JacSource(self.load_fixture("fam.jac"), mod_path=""))
         self.assertFalse(prse.errors_had)
 
+    def test_tree_to_ast_subclass_rules(self) -> None:
+        """Test rules overridden on a TreeToAST subclass are used."""
+        seen: list[str] = []
+
+        class TrackingTreeToAST(JacParser.TreeToAST):
+            def global_var(self, kid: list) -> ast.GlobalVars:
+                """Track global_var reductions."""
+                seen.append("global_var")
+                return super().global_var(kid)
+
+            def atom(self, kid: list) -> ast.Expr:
+                """Track atom reductions."""
+                seen.append("atom")
+                return super().atom(kid)
+
+        prse = JacParser(input_ir=JacSource("glob y = 2;", mod_path=""))
+        mod, _ = JacParser.parse(
+            "glob y = 2;",
+            on_error=prse.error_callback,
+            tree_to_ast=TrackingTreeToAST(parser=prse),
+        )
+        self.assertIsInstance(mod, ast.Module)
+        self.assertIn("global_var", seen)
+        self.assertIn("atom", seen)
+        seen.clear()
+        JacParser(input_ir=JacSource("glob y = 2;", mod_path=""))
+        self.assertEqual(seen, [])
+
+    def test_dev_mode_parser(self) -> None:
+        """Test the dev mode lark parser builds the same AST."""
+        std = JacParser(input_ir=JacSource(self.load_fixture("fam.jac"), mod_path=""))
+        level, transformer = logger.level, JacParser.JacTransformer
+        # make_dev swaps class-level parser state, restore it for later tests
+        with patch.object(JacParser, "dev_mode", True), patch.object(
+            JacParser, "parser", JacParser.parser
+        ), patch.object(JacParser, "JacTransformer", JacParser.JacTransformer):
+            try:
+                dev = JacParser(
+                    input_ir=JacSource(self.load_fixture("fam.jac"), mod_path="")
+                )
+                bad = JacParser(input_ir=JacSource("glob y = ;", mod_path=""))
+                self.assertIsInstance(JacParser.parser, Lark)
+            finally:
+                logger.setLevel(level)
+        self.assertNotIsInstance(JacParser.parser, Lark)
+        self.assertIs(JacParser.JacTransformer, transformer)
+        self.assertFalse(JacParser.dev_mode)
+        self.assertFalse(dev.errors_had)
+        self.assertEqual(dev.ir.to_dict(), std.ir.to_dict())
+        self.assertIn("Syntax Error", str(bad.errors_had[0]))
+
     def test_staticmethod_checks_out(self) -> None:
         """Parse micro jac file."""
         prse = JacParser(
@@ -62,33 +140,15 @@ class TestLarkParser(TestCaseMicroSuite):
 
     def test_enum_matches_lark_toks(self) -> None:
         """Test that enum stays synced with lexer."""
-        tokens = [x.name for x in jl.Lark_StandAlone().parser.lexer_conf.terminals]
-        for token in tokens:
-            self.assertIn(token, Tokens.__members__)
-        for token in Tokens:
-            self.assertIn(token.name, tokens)
-        for token in Tokens:
-            self.assertIn(token.value, tokens)
+        enum_names = frozenset(Tokens.__members__)
+        enum_values = frozenset(token.value for token in Tokens)
+        self.assertEqual(_TERMINAL_NAMES, enum_names)
+        self.assertLessEqual(enum_values, _TERMINAL_NAMES)
 
     def test_parser_impl_all_rules(self) -> None:
         """Test that enum stays synced with lexer."""
-        rules = {
-            x.origin.name
-            for x in jl.Lark_StandAlone().parser.parser_conf.rules
-            if not x.origin.name.startswith("_")
-        }
-        parse_funcs = []
-        for name, value in inspect.getmembers(JacParser.TreeToAST):
-            if inspect.isfunction(value) and not getattr(
-                JacParser.TreeToAST.__base__, value.__name__, False
-            ):
-                parse_funcs.append(name)
-        for i in rules:
-            self.assertIn(i, parse_funcs)
-        for i in parse_funcs:
-            if i in ["binary_expr_unwind", "ice", "nu"]:
-                continue
-            self.assertIn(i, rules)
+        parse_funcs = _PARSE_FUNCS - {"binary_expr_unwind", "ice", "nu"}
+        self.assertEqual(_RULE_NAMES ^ parse_funcs, frozenset())
 
 
 TestLarkParser.self_attach_micro_tests()
@@ -63,7 +63,7 @@ class Workspace:
         ]:
             if file in self.modules:
                 continue
-            with open(file, "r") as f:
+            with open(file, "rb") as f:
                 source = f.read()
             build = jac_str_to_pass(
                 jac_str=source,
@@ -100,7 +100,7 @@ class Workspace:
 
     def rebuild_file(self, file_path: str, deep: bool = False) -> bool:
         """Rebuild a file."""
-        with open(file_path, "r") as f:
+        with open(file_path, "rb") as f:
             source = f.read()
         build = jac_str_to_pass(
             jac_str=source,
@@ -4,9 +4,14 @@ import io
 import sys
 
 
+import jaclang.compiler.absyntree as ast
 from jaclang import jac_import
 from jaclang.cli import cli
-from jaclang.compiler.compile import jac_file_to_pass, jac_str_to_pass
+from jaclang.compiler.compile import (
+    jac_file_formatter,
+    jac_file_to_pass,
+    jac_str_to_pass,
+)
 from jaclang.core import construct
 from jaclang.utils.test import TestCase
 
@@ -392,3 +397,19 @@ class JacLanguageTests(TestCase):
         sys.stdout = sys.__stdout__
         stdout_value = captured_output.getvalue()
         self.assertIn("2.0\n", stdout_value)
+
+    def test_crlf_source(self) -> None:
+        """Test CRLF sources read the same as LF sources."""
+        with open(self.fixture_abs_path("crlf_doc.jac"), "rb") as f:
+            self.assertIn(b"\r\n", f.read())
+        mypass = jac_file_to_pass(self.fixture_abs_path("crlf_doc.jac"))
+        self.assertFalse(mypass.errors_had)
+        assert isinstance(mypass.ir, ast.Module)
+        self.assertNotIn("\r", mypass.ir.source.code)
+        self.assertIn('"""Doc\nstring."""', mypass.ir.gen.py)
+        formatted = jac_file_formatter(self.fixture_abs_path("crlf_doc.jac"))
+        self.assertNotIn("\r", formatted.ir.gen.jac)
+        self.assertEqual(
+            self.file_to_str(self.fixture_abs_path("crlf_doc.jac")),
+            mypass.ir.source.code,
+        )
@@ -1,5 +1,6 @@
 """Test case utils for Jaseci."""
 
+import functools
 import inspect
 import os
 from abc import ABC, abstractmethod
@@ -12,6 +13,17 @@ from jaclang.compiler.passes import Pass
 from jaclang.utils.helpers import get_ast_nodes_as_snake_case as ast_snakes
 
 
+@functools.lru_cache(maxsize=1)
+def _micro_jac_files(base_dir: str) -> tuple[str, ...]:
+    """Collect the micro suite jac files under base_dir."""
+    return tuple(
+        os.path.normpath(os.path.join(root, name))
+        for root, _, files in os.walk(base_dir)
+        for name in files
+        if name.endswith(".jac") and not name.startswith("err")
+    )
+
+
 class TestCase(_TestCase):
     """Base test case for Jaseci."""
 
@@ -38,8 +50,9 @@ class TestCase(_TestCase):
 
     def file_to_str(self, file_path: str) -> str:
         """Load fixture from fixtures directory."""
-        with open(file_path, "r") as f:
-            return f.read()
+        with open(os.path.abspath(file_path), "rb") as f:
+            # Same newline handling as the compiler's source reads (JacSource)
+            return f.read().decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
 
     def fixture_abs_path(self, fixture: str) -> str:
         """Get absolute path of a fixture from fixtures directory."""
@@ -63,14 +76,9 @@ class TestCaseMicroSuite(ABC, TestCase):
     @classmethod
     def self_attach_micro_tests(cls) -> None:
         """Attach micro tests."""
-        for filename in [
-            os.path.normpath(os.path.join(root, name))
-            for root, _, files in os.walk(
-                os.path.dirname(os.path.dirname(jaclang.__file__))
-            )
-            for name in files
-            if name.endswith(".jac") and not name.startswith("err")
-        ]:
+        for filename in _micro_jac_files(
+            os.path.dirname(os.path.dirname(jaclang.__file__))
+        ):
             method_name = (
                 f"test_micro_{filename.replace('.jac', '').replace(os.sep, '_')}"
             )
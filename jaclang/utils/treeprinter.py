@@ -138,29 +138,33 @@ def print_ast_tree(
     if not level_markers:
         level_markers = []
     level = len(level_markers)  # recursion level
+    lines: list[str] = []
 
     def mapper(draw: bool) -> str:
         return connection_str if draw else empty_str
 
-    markers = "".join(map(mapper, level_markers[:-1]))
-    markers += marker if level > 0 else ""
-
-    if isinstance(root, ast.AstNode):
-        tree_str = f"{root.loc}\t{markers}{__node_repr_in_tree(root)}\n"
-        for i, child in enumerate(root.kid):
-            is_last = i == len(root.kid) - 1
-            tree_str += print_ast_tree(
-                child, marker, [*level_markers, not is_last], output_file, max_depth
-            )
-    elif isinstance(root, ast3.AST):
-        tree_str = (
-            f"{get_location_info(root)}\t{markers}{__node_repr_in_py_tree(root)}\n"
-        )
-        for i_a, child_a in enumerate(ast3.iter_child_nodes(root)):
-            is_last = i_a == len(list(ast3.iter_child_nodes(root))) - 1
-            tree_str += print_ast_tree(
-                child_a, marker, [*level_markers, not is_last], output_file, max_depth
+    def walk(node: AstNode | ast3.AST, level_markers: list[bool]) -> None:
+        if max_depth is not None and len(level_markers) >= max_depth:
+            return
+        markers = "".join(map(mapper, level_markers[:-1]))
+        markers += marker if level_markers else ""
+
+        if isinstance(node, ast.AstNode):
+            lines.append(f"{node.loc}\t{markers}{__node_repr_in_tree(node)}\n")
+            for i, child in enumerate(node.kid):
+                is_last = i == len(node.kid) - 1
+                walk(child, [*level_markers, not is_last])
+        elif isinstance(node, ast3.AST):
+            lines.append(
+                f"{get_location_info(node)}\t{markers}{__node_repr_in_py_tree(node)}\n"
             )
+            children = list(ast3.iter_child_nodes(node))
+            for i_a, child_a in enumerate(children):
+                is_last = i_a == len(children) - 1
+                walk(child_a, [*level_markers, not is_last])
+
+    walk(root, level_markers)
+    tree_str = "".join(lines)
 
     # Write to file only at the top level call
     if output_file and level == 0: